@@ -3,82 +3,138 @@
 This module handles OAuth 2.0 authentication with Adobe Identity Management System (IMS).
 """
 
+import asyncio
 import time
 import webbrowser
 import json
 import os
-from urllib.parse import urlencode
-import http.server
-import socketserver
+import pathlib
+import socket
+from urllib.parse import urlencode, parse_qs, urlparse
 import threading
 import base64
+import random
+import hashlib
+import secrets
+import atexit
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
 import httpx
 
+try:
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    # Fall back to the stdlib encoder/decoder when orjson isn't installed
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
 from . import config
 
+# Authorization URL up to the per-flow PKCE challenge
+_STATIC_AUTH_PARAMS = {
+    "client_id": config.ADOBE_CLIENT_ID,
+    "redirect_uri": config.ADOBE_REDIRECT_URI,
+    "response_type": "code",
+    "scope": "openid,AdobeID,creative_sdk,lr_partner_apis",
+    "code_challenge_method": "S256",
+}
+_AUTH_URL_PREFIX = f"{config.ADOBE_AUTH_URL}?{urlencode(_STATIC_AUTH_PARAMS)}"
+
+# Token storage, created once at import
+_TOKENS_DIR = pathlib.Path.home() / ".adobe_mcp"
+_TOKENS_DIR.mkdir(parents=True, exist_ok=True)
+_TOKEN_FILE = _TOKENS_DIR / "tokens.json"
+
+# In-process cache of the decoded token file, keyed on its modification time
+_TOKEN_CACHE = {"data": None, "mtime": 0, "expires_at": 0}
+_token_cache_lock = threading.Lock()
+
+# Pooled client for IMS so token exchanges reuse the TCP/TLS connection
+_ims_client = None
+_ims_client_lock = threading.Lock()
+
+# Background timer that refreshes the access token ahead of expiry
+_refresher = None
+_refresher_lock = threading.Lock()
+
+# Retry and pacing for the IMS token endpoint
+_TOKEN_REQUEST_ATTEMPTS = 4
+_MIN_TOKEN_REQUEST_INTERVAL = 0.1  # seconds between token requests
+_MAX_RETRY_DELAY = 8.0  # seconds
+_last_token_request_at = 0.0
+_token_pacing_lock = threading.Lock()
+
+# Single-flight guard so concurrent callers share one IMS refresh
+_refresh_lock = threading.Lock()
+_refresh_inflight = None
+
 class AuthError(Exception):
     """Exception raised for authentication errors."""
     pass
 
 def generate_code_verifier():
     """Generate a code verifier for PKCE."""
-    import secrets
-    return base64.urlsafe_b64encode(secrets.token_bytes(32)).decode('utf-8').rstrip('=')
+    return secrets.token_urlsafe(32)
 
 def generate_code_challenge(verifier):
     """Generate a code challenge from the verifier."""
-    import hashlib
-    challenge_bytes = hashlib.sha256(verifier.encode('utf-8')).digest()
-    return base64.urlsafe_b64encode(challenge_bytes).decode('utf-8').rstrip('=')
+    challenge_bytes = hashlib.sha256(verifier.encode('ascii')).digest()
+    return base64.urlsafe_b64encode(challenge_bytes).rstrip(b'=').decode('ascii')
 
-class CallbackHandler(http.server.BaseHTTPRequestHandler):
-    """HTTP handler for OAuth callback."""
-    
-    code = None
-    
-    def do_GET(self):
-        """Handle GET request to callback URL."""
-        from urllib.parse import parse_qs, urlparse
-        
-        query = parse_qs(urlparse(self.path).query)
-        if 'code' in query:
-            CallbackHandler.code = query['code'][0]
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(b"<html><body><h1>Authentication successful!</h1><p>You can close this window now.</p></body></html>")
-        else:
-            self.send_response(400)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(b"<html><body><h1>Authentication failed!</h1><p>No authorization code received.</p></body></html>")
+def _http_response(status, body):
+    """Build a complete HTTP/1.1 response for the OAuth callback."""
+    return (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: text/html\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    ).encode("ascii") + body
+
+_CALLBACK_SUCCESS = _http_response(
+    "200 OK",
+    b"<html><body><h1>Authentication successful!</h1><p>You can close this window now.</p></body></html>",
+)
+_CALLBACK_FAILURE = _http_response(
+    "400 Bad Request",
+    b"<html><body><h1>Authentication failed!</h1><p>No authorization code received.</p></body></html>",
+)
+_CALLBACK_NO_CONTENT = b"HTTP/1.1 204 No Content\r\nConnection: close\r\n\r\n"
+
+# Path the IMS redirect lands on; anything else (e.g. favicon) is ignored
+_CALLBACK_PATH = urlparse(config.ADOBE_REDIRECT_URI).path or "/"
+
+def _read_request_path(conn):
+    """Read an HTTP request head from a socket and return its path."""
+    data = b""
+    while b"\r\n\r\n" not in data and len(data) < 8192:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
     
-    def log_message(self, format, *args):
-        """Suppress server logs."""
-        return
+    request_line = data.decode("latin-1").partition("\r\n")[0]
+    parts = request_line.split(" ", 2)
+    return parts[1] if len(parts) > 1 else ""
 
 def get_authorization_code():
     """Get authorization code through browser flow."""
     code_verifier = generate_code_verifier()
     code_challenge = generate_code_challenge(code_verifier)
     
-    # Start callback server
-    server = socketserver.TCPServer(("localhost", 8000), CallbackHandler)
-    server_thread = threading.Thread(target=server.serve_forever)
-    server_thread.daemon = True
-    server_thread.start()
+    # Listen for the single callback request
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind(("localhost", 8000))
+        sock.listen(1)
+    except OSError:
+        sock.close()
+        raise
     
-    # Build authorization URL
-    params = {
-        "client_id": config.ADOBE_CLIENT_ID,
-        "redirect_uri": config.ADOBE_REDIRECT_URI,
-        "response_type": "code",
-        "scope": "openid,AdobeID,creative_sdk,lr_partner_apis",
-        "code_challenge_method": "S256",
-        "code_challenge": code_challenge,
-    }
-    auth_url = f"{config.ADOBE_AUTH_URL}?{urlencode(params)}"
+    # Build authorization URL (the challenge is base64url, so needs no quoting)
+    auth_url = f"{_AUTH_URL_PREFIX}&code_challenge={code_challenge}"
     
     # Open browser for user authentication
     print(f"Opening browser for authentication...")
@@ -86,19 +142,108 @@ def get_authorization_code():
     
     # Wait for callback
     print("Waiting for authentication callback...")
-    timeout = 300  # 5 minutes
-    start_time = time.time()
+    deadline = time.monotonic() + 300  # 5 minutes
+    
+    try:
+        while True:
+            # A zero timeout would make accept() non-blocking rather than time out
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise AuthError("Authentication timed out after 5 minutes")
+            sock.settimeout(remaining)
+            try:
+                conn, _ = sock.accept()
+            except socket.timeout:
+                raise AuthError("Authentication timed out after 5 minutes")
+            
+            with conn:
+                try:
+                    # A stalled connection can't hold the flow past the deadline
+                    conn.settimeout(min(config.REQUEST_TIMEOUT, remaining))
+                    url = urlparse(_read_request_path(conn))
+                    if not url.path.startswith(_CALLBACK_PATH):
+                        # Browsers also fetch things like /favicon.ico; keep waiting
+                        conn.sendall(_CALLBACK_NO_CONTENT)
+                        continue
+                except (socket.timeout, OSError):
+                    # A stalled or dropped connection (e.g. a browser preconnect)
+                    # is skipped; only the deadline ends the flow
+                    continue
+                
+                query = parse_qs(url.query)
+                response = _CALLBACK_SUCCESS if 'code' in query else _CALLBACK_FAILURE
+                try:
+                    conn.sendall(response)
+                except (socket.timeout, OSError):
+                    # The browser went away, but the callback itself arrived
+                    pass
+                if 'code' not in query:
+                    raise AuthError("No authorization code received")
+                break
+    finally:
+        # Closing right away also stops browser reloads reaching a stale flow
+        sock.close()
     
-    while CallbackHandler.code is None:
-        if time.time() - start_time > timeout:
-            server.shutdown()
-            raise AuthError("Authentication timed out after 5 minutes")
-        time.sleep(1)
+    return query['code'][0], code_verifier
+
+def _get_ims_client():
+    """Get the shared IMS HTTP client, creating it on first use."""
+    global _ims_client
+    if _ims_client is None:
+        with _ims_client_lock:
+            if _ims_client is None:
+                _ims_client = httpx.Client(
+                    timeout=config.REQUEST_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=4),
+                )
+    return _ims_client
+
+atexit.register(lambda: _ims_client and _ims_client.close())
+
+def _retry_delay(response, attempt):
+    """Get how long to wait before retrying a failed token request."""
+    if response is not None and response.status_code == 429:
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            pass
+        else:
+            # Don't let the server park a caller for hours (or pass a negative)
+            return max(0.0, min(_MAX_RETRY_DELAY, retry_after))
+    return min(_MAX_RETRY_DELAY, 0.5 * 2 ** attempt) + random.random() * 0.1
+
+def _post_token_request(data):
+    """POST to the IMS token endpoint, retrying transient failures.
     
-    # Shutdown server
-    server.shutdown()
+    Requests are spaced at least _MIN_TOKEN_REQUEST_INTERVAL apart so
+    concurrent callers don't stampede a recovering IMS. 429 and 5xx
+    responses and transport errors are retried with backoff; the last
+    response is returned (or the last error raised) once attempts run out.
+    """
+    global _last_token_request_at
+    client = _get_ims_client()
     
-    return CallbackHandler.code, code_verifier
+    for attempt in range(_TOKEN_REQUEST_ATTEMPTS):
+        with _token_pacing_lock:
+            delta = time.monotonic() - _last_token_request_at
+            if delta < _MIN_TOKEN_REQUEST_INTERVAL:
+                time.sleep(_MIN_TOKEN_REQUEST_INTERVAL - delta)
+            _last_token_request_at = time.monotonic()
+        
+        last_attempt = attempt == _TOKEN_REQUEST_ATTEMPTS - 1
+        try:
+            response = client.post(config.ADOBE_TOKEN_URL, data=data)
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            response = None
+        else:
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            if last_attempt:
+                return response
+        
+        time.sleep(_retry_delay(response, attempt))
 
 def get_access_token(auth_code, code_verifier):
     """Exchange authorization code for access token."""
@@ -111,13 +256,12 @@ def get_access_token(auth_code, code_verifier):
         "code_verifier": code_verifier,
     }
     
-    client = httpx.Client(timeout=config.REQUEST_TIMEOUT)
-    response = client.post(config.ADOBE_TOKEN_URL, data=data)
+    response = _post_token_request(data)
     
     if response.status_code != 200:
         raise AuthError(f"Failed to get access token: {response.text}")
     
-    return response.json()
+    return _json_loads(response.content)
 
 def refresh_access_token(refresh_token):
     """Refresh an expired access token."""
@@ -128,58 +272,145 @@ def refresh_access_token(refresh_token):
         "refresh_token": refresh_token,
     }
     
-    client = httpx.Client(timeout=config.REQUEST_TIMEOUT)
-    response = client.post(config.ADOBE_TOKEN_URL, data=data)
+    response = _post_token_request(data)
     
     if response.status_code != 200:
         raise AuthError(f"Failed to refresh access token: {response.text}")
     
-    return response.json()
+    return _json_loads(response.content)
 
 def save_tokens(token_data):
     """Save tokens to a file for later use."""
-    tokens_dir = os.path.expanduser("~/.adobe_mcp")
-    os.makedirs(tokens_dir, exist_ok=True)
-    
-    token_file = os.path.join(tokens_dir, "tokens.json")
     token_data["timestamp"] = int(time.time())
     
-    with open(token_file, "w") as f:
-        json.dump(token_data, f)
+    # Write to a sibling file and swap it in so readers never see a partial file,
+    # and a crash mid-write can't corrupt the saved tokens. The file holds the
+    # refresh token, so it is created readable by the current user only.
+    tmp_file = _TOKEN_FILE.with_suffix(".tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_json_dumps(token_data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.chmod(tmp_file, 0o600)
+    os.replace(tmp_file, _TOKEN_FILE)
     
-    print(f"Tokens saved to {token_file}")
+    with _token_cache_lock:
+        _TOKEN_CACHE["mtime"] = 0
+    
+    print(f"Tokens saved to {_TOKEN_FILE}")
     return token_data
 
 def load_tokens():
     """Load tokens from file, refreshing if necessary."""
-    token_file = os.path.expanduser("~/.adobe_mcp/tokens.json")
-    
-    if not os.path.exists(token_file):
+    try:
+        st = _TOKEN_FILE.stat()
+    except FileNotFoundError:
         return None
     
-    with open(token_file, "r") as f:
-        token_data = json.load(f)
-    
-    # Check if access token is expired (tokens typically last 24 hours)
-    expires_in = token_data.get("expires_in", 86400)  # Default 24 hours
-    timestamp = token_data.get("timestamp", 0)
-    current_time = int(time.time())
+    with _token_cache_lock:
+        # Serve from cache while the file is unchanged and the token is fresh
+        if (st.st_mtime_ns == _TOKEN_CACHE["mtime"]
+                and time.time() < _TOKEN_CACHE["expires_at"] - 300):
+            return _TOKEN_CACHE["data"]
+        
+        token_data = _json_loads(_TOKEN_FILE.read_bytes())
+        
+        # Check if access token is expired (tokens typically last 24 hours)
+        expires_in = token_data.get("expires_in", 86400)  # Default 24 hours
+        timestamp = token_data.get("timestamp", 0)
+        expires_at = timestamp + expires_in
+        
+        _TOKEN_CACHE["data"] = token_data
+        _TOKEN_CACHE["mtime"] = st.st_mtime_ns
+        _TOKEN_CACHE["expires_at"] = expires_at
     
-    if current_time - timestamp > expires_in - 300:  # Refresh 5 minutes before expiry
+    # The background refresher normally renews tokens well ahead of expiry;
+    # refreshing inline here is only a fallback (e.g. clock skew or sleep).
+    if time.time() > expires_at - 300:  # Refresh 5 minutes before expiry
         try:
-            refresh_token = token_data.get("refresh_token")
-            if refresh_token:
-                new_token_data = refresh_access_token(refresh_token)
-                # Make sure we keep the refresh token if it's not in the response
-                if "refresh_token" not in new_token_data and "refresh_token" in token_data:
-                    new_token_data["refresh_token"] = token_data["refresh_token"]
-                return save_tokens(new_token_data)
+            return _refresh_tokens(token_data)
         except AuthError as e:
             print(f"Error refreshing token: {e}")
             return None
     
     return token_data
 
+def _refresh_tokens(token_data):
+    """Refresh and persist tokens, returning the new token data.
+    
+    Only one refresh runs at a time; callers arriving while one is in
+    flight wait for and share its result. Returns the given token data
+    unchanged if it has no refresh token.
+    """
+    global _refresh_inflight
+    refresh_token = token_data.get("refresh_token")
+    if not refresh_token:
+        return token_data
+    
+    with _refresh_lock:
+        inflight = _refresh_inflight
+        if inflight is None:
+            future = _refresh_inflight = Future()
+    
+    if inflight is not None:
+        try:
+            return inflight.result(timeout=30)
+        except FutureTimeoutError:
+            raise AuthError("Timed out waiting for token refresh")
+    
+    try:
+        new_token_data = refresh_access_token(refresh_token)
+        # Make sure we keep the refresh token if it's not in the response
+        if "refresh_token" not in new_token_data:
+            new_token_data["refresh_token"] = refresh_token
+        new_token_data = save_tokens(new_token_data)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(new_token_data)
+    finally:
+        with _refresh_lock:
+            _refresh_inflight = None
+    
+    return new_token_data
+
+def _start_refresher(token_data):
+    """Schedule a background refresh 10 minutes before the token expires."""
+    global _refresher
+    if _refresher is not None or not token_data.get("refresh_token"):
+        return
+    
+    with _refresher_lock:
+        if _refresher is not None:
+            return
+        expires_at = token_data.get("timestamp", 0) + token_data.get("expires_in", 86400)
+        delay = max(60, expires_at - 600 - time.time())
+        _refresher = threading.Timer(delay, _do_refresh)
+        _refresher.daemon = True
+        _refresher.start()
+
+def _do_refresh():
+    """Refresh tokens from the background timer and reschedule it."""
+    global _refresher
+    with _refresher_lock:
+        _refresher = None
+    
+    token_data = load_tokens()
+    if not token_data:
+        return
+    
+    expires_at = token_data.get("timestamp", 0) + token_data.get("expires_in", 86400)
+    if time.time() > expires_at - 600:
+        try:
+            token_data = _refresh_tokens(token_data)
+        except AuthError as e:
+            # Keep the old tokens and retry on the next tick
+            print(f"Error refreshing token: {e}")
+    
+    _start_refresher(token_data)
+
 def get_authorization_header():
     """Get the authorization header for API requests."""
     token_data = load_tokens()
@@ -187,21 +418,33 @@ def get_authorization_header():
     if not token_data or "access_token" not in token_data:
         return None
     
+    _start_refresher(token_data)
     return f"Bearer {token_data['access_token']}"
 
+async def get_authorization_header_async():
+    """Get the authorization header without blocking the event loop.
+    
+    Loading tokens may refresh them over the network (with retries), so it
+    runs on the default executor.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_authorization_header)
+
 def authenticate():
     """Main authentication function to get Adobe API access."""
     # Check if we already have valid tokens
     tokens = load_tokens()
     if tokens and "access_token" in tokens:
         print("Using existing access token")
+        _start_refresher(tokens)
         return tokens
     
     # Otherwise, start the authentication flow
     try:
         auth_code, code_verifier = get_authorization_code()
-        token_data = get_access_token(auth_code, code_verifier)
-        return save_tokens(token_data)
+        token_data = save_tokens(get_access_token(auth_code, code_verifier))
+        _start_refresher(token_data)
+        return token_data
     except AuthError as e:
         print(f"Authentication error: {e}")
         return None
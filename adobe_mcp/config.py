@@ -23,6 +23,16 @@ ADOBE_TOKEN_URL = f"{ADOBE_IMS_URL}/ims/token/v3"
 # MCP Server settings
 MCP_HOST = os.getenv("MCP_HOST", "localhost")
 MCP_PORT = int(os.getenv("MCP_PORT", "8080"))
+MCP_MAX_WORKERS = int(os.getenv("MCP_MAX_WORKERS", "8"))
+
+# Port of the After Effects CEP extension that runs ExtendScript over a socket
+AFTER_EFFECTS_SCRIPT_PORT = int(os.getenv("AFTER_EFFECTS_SCRIPT_PORT", "9999"))
+
+# Unix socket of the Premiere Pro CEP extension that runs ExtendScript
+PREMIERE_SCRIPT_SOCKET = os.getenv("PREMIERE_SCRIPT_SOCKET", "/tmp/premiere_mcp.sock")
+
+# Add simulated execution time to script runs that fall back to a script file
+SIMULATE = bool(int(os.getenv("ADOBE_MCP_SIMULATE", "0")))
 
 # Default timeout for API requests (in seconds)
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30")) 
\ No newline at end of file
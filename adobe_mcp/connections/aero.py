@@ -6,11 +6,29 @@ Note: This is highly exploratory as Aero lacks comprehensive public APIs.
 
 import os
 import json
+import atexit
+import threading
+
 import httpx
 
 from .. import config
 from .. import auth
 
+# Connection pool shared by every AeroConnection instance
+_client = None
+_client_lock = threading.Lock()
+
+def _get_client():
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(timeout=config.REQUEST_TIMEOUT)
+    return _client
+
+atexit.register(lambda: _client and _client.close())
+
 class AeroError(Exception):
     """Exception raised for Adobe Aero operation errors."""
     pass
@@ -23,11 +41,18 @@ class AeroConnection:
     future API endpoints or alternative integration approaches.
     """
     
+    _STATIC_HEADERS = {
+        "X-API-Key": config.ADOBE_CLIENT_ID,
+        "Content-Type": "application/json"
+    }
+    
     def __init__(self):
         """Initialize Adobe Aero connection."""
         # Theoretical base URL for future Aero API
         self.base_url = "https://aero.adobe.io/api/v1"
-        self.client = httpx.Client(timeout=config.REQUEST_TIMEOUT)
+        self.client = _get_client()
+        self._cached_headers = None
+        self._headers_token = None
         self.check_availability()
     
     def check_availability(self):
@@ -50,11 +75,12 @@ class AeroConnection:
         if not auth_header:
             raise AeroError("Not authenticated. Run authentication flow first.")
         
-        return {
-            "Authorization": auth_header,
-            "X-API-Key": config.ADOBE_CLIENT_ID,
-            "Content-Type": "application/json"
-        }
+        # Rebuild only when the token has changed (e.g. after a refresh)
+        if auth_header != self._headers_token:
+            self._cached_headers = {**self._STATIC_HEADERS, "Authorization": auth_header}
+            self._headers_token = auth_header
+        
+        return self._cached_headers
     
     def list_projects(self):
         """List Aero projects for the current user.
@@ -6,10 +6,105 @@ It assumes After Effects is installed and running on the local system.
 """
 
 import os
+import functools
+import shutil
+import socket
 import tempfile
 import subprocess
 import time
 import json
+import string
+
+from .. import config
+from .script_host import ScriptHostClient, ScriptHostError
+
+# ExtendScript bodies are parsed once; parameters are substituted as
+# JSON-encoded literals so user input can't break out of the script.
+_OPEN_PROJECT_SCRIPT = string.Template("""
+        var app = new Application();
+        app.open(new File($project_path));
+        $$.writeln("Project opened successfully");
+        """)
+
+_RENDER_SCRIPT = string.Template("""
+        var app = new Application();
+        var project = app.project;
+        
+        // Find the composition by name
+        var comp = null;
+        for (var i = 1; i <= project.numItems; i++) {
+            if (project.item(i) instanceof CompItem && project.item(i).name === $comp_name) {
+                comp = project.item(i);
+                break;
+            }
+        }
+        
+        if (comp === null) {
+            $$.writeln("ERROR: Composition not found");
+        } else {
+            // Add to render queue
+            var renderQueueItem = app.project.renderQueue.items.add(comp);
+            
+            // Set render settings template
+            var rsTemplate = $render_settings;
+            if (rsTemplate !== "") {
+                renderQueueItem.applyTemplate(rsTemplate);
+            }
+            
+            // Set output module template
+            var omTemplate = $output_module;
+            if (omTemplate !== "") {
+                var outputModule = renderQueueItem.outputModule(1);
+                outputModule.applyTemplate(omTemplate);
+            }
+            
+            // Set output path
+            var outputModule = renderQueueItem.outputModule(1);
+            outputModule.file = new File($output_path);
+            
+            // Start render
+            app.project.renderQueue.render();
+            $$.writeln("Render started for composition: " + comp.name);
+        }
+        """)
+
+_TEXT_LAYER_SCRIPT = string.Template("""
+        var app = new Application();
+        var project = app.project;
+        
+        // Find the composition by name
+        var comp = null;
+        for (var i = 1; i <= project.numItems; i++) {
+            if (project.item(i) instanceof CompItem && project.item(i).name === $comp_name) {
+                comp = project.item(i);
+                break;
+            }
+        }
+        
+        if (comp === null) {
+            $$.writeln("ERROR: Composition not found");
+        } else {
+            // Create a text layer
+            var textLayer = comp.layers.addText($text_content);
+            
+            // Set position if provided
+            $position_code
+            
+            // Set duration if provided
+            $duration_code
+            
+            $$.writeln("Text layer created in composition: " + comp.name);
+        }
+        """)
+
+@functools.lru_cache(maxsize=1)
+def _ae_installed():
+    """Check once per process whether After Effects is installed."""
+    # This is a simplified check for demonstration
+    if os.name == 'posix':  # macOS or Linux
+        return os.path.exists("/Applications/Adobe After Effects.app")
+    # A more sophisticated check would be needed for Windows
+    return True
 
 class AfterEffectsError(Exception):
     """Exception raised for After Effects operation errors."""
@@ -25,19 +120,35 @@ class AfterEffectsConnection:
     
     def __init__(self):
         """Initialize After Effects connection."""
-        self.script_dir = tempfile.mkdtemp(prefix="ae_mcp_")
         self.check_installation()
+        self.simulate = config.SIMULATE
+        # Created lazily, only needed when the script host isn't reachable
+        self.script_dir = None
+        # The script host is a CEP extension listening on a local TCP port;
+        # scripts run through a temporary file when it isn't running
+        self._script_host = ScriptHostClient(
+            socket.AF_INET, ("127.0.0.1", config.AFTER_EFFECTS_SCRIPT_PORT)
+        )
+    
+    def _send_script(self, script_content):
+        """Run a script on the script host and return its JSON reply."""
+        try:
+            return self._script_host.run(script_content)
+        except ScriptHostError as e:
+            # The client drops the broken connection; later scripts use the file fallback
+            raise AfterEffectsError(f"Failed to execute script: {e}")
+    
+    def close(self):
+        """Close the script host connection and remove the script file, if any."""
+        self._script_host.close()
+        if self.script_dir is not None:
+            shutil.rmtree(self.script_dir, ignore_errors=True)
+            self.script_dir = None
     
     def check_installation(self):
         """Check if After Effects is installed."""
-        # This is a simplified check for demonstration
-        if os.name == 'posix':  # macOS or Linux
-            app_path = "/Applications/Adobe After Effects.app"
-            if not os.path.exists(app_path):
-                raise AfterEffectsError("After Effects not found at default installation path.")
-        elif os.name == 'nt':  # Windows
-            # A more sophisticated check would be needed for Windows
-            pass
+        if not _ae_installed():
+            raise AfterEffectsError("After Effects not found at default installation path.")
     
     def run_script(self, script_content):
         """Run an ExtendScript in After Effects.
@@ -45,8 +156,14 @@ class AfterEffectsConnection:
         This is a theoretical implementation. Adobe applications support
         ExtendScript, but the exact mechanism to run scripts externally
         may vary and require application-specific approaches.
+        Scripts are sent to the CEP script host when it is connected.
         """
+        if self._script_host.connected:
+            return self._send_script(script_content)
+        
         # Write script to temporary file
+        if self.script_dir is None:
+            self.script_dir = tempfile.mkdtemp(prefix="ae_mcp_")
         script_path = os.path.join(self.script_dir, "temp_script.jsx")
         with open(script_path, "w") as f:
             f.write(script_content)
@@ -71,76 +188,25 @@ class AfterEffectsConnection:
             # subprocess.run(cmd, check=True, capture_output=True)
             
             # For demonstration, we'll simulate success
-            time.sleep(1)  # Simulate execution time
+            if self.simulate:
+                time.sleep(1)  # Simulate execution time
             return {"status": "success", "message": "Script executed successfully"}
         except subprocess.CalledProcessError as e:
             raise AfterEffectsError(f"Failed to execute script: {e}")
     
     def open_project(self, project_path):
         """Open an After Effects project."""
-        script = f"""
-        var app = new Application();
-        app.open(new File("{project_path}"));
-        $.writeln("Project opened successfully");
-        """
+        script = _OPEN_PROJECT_SCRIPT.substitute(project_path=json.dumps(project_path))
         return self.run_script(script)
     
     def render_composition(self, comp_name, output_path, render_settings=None, output_module=None):
         """Render a composition from the current project."""
-        settings_code = ""
-        module_code = ""
-        
-        if render_settings:
-            settings_code = f'var rsTemplate = "{render_settings}";'
-        else:
-            settings_code = 'var rsTemplate = "Best Settings";'
-            
-        if output_module:
-            module_code = f'var omTemplate = "{output_module}";'
-        else:
-            module_code = 'var omTemplate = "Lossless";'
-            
-        script = f"""
-        var app = new Application();
-        var project = app.project;
-        
-        // Find the composition by name
-        var comp = null;
-        for (var i = 1; i <= project.numItems; i++) {{
-            if (project.item(i) instanceof CompItem && project.item(i).name === "{comp_name}") {{
-                comp = project.item(i);
-                break;
-            }}
-        }}
-        
-        if (comp === null) {{
-            $.writeln("ERROR: Composition not found");
-        }} else {{
-            // Add to render queue
-            var renderQueueItem = app.project.renderQueue.items.add(comp);
-            
-            // Set render settings template
-            {settings_code}
-            if (rsTemplate !== "") {{
-                renderQueueItem.applyTemplate(rsTemplate);
-            }}
-            
-            // Set output module template
-            {module_code}
-            if (omTemplate !== "") {{
-                var outputModule = renderQueueItem.outputModule(1);
-                outputModule.applyTemplate(omTemplate);
-            }}
-            
-            // Set output path
-            var outputModule = renderQueueItem.outputModule(1);
-            outputModule.file = new File("{output_path}");
-            
-            // Start render
-            app.project.renderQueue.render();
-            $.writeln("Render started for composition: " + comp.name);
-        }}
-        """
+        script = _RENDER_SCRIPT.substitute(
+            comp_name=json.dumps(comp_name),
+            output_path=json.dumps(output_path),
+            render_settings=json.dumps(render_settings or "Best Settings"),
+            output_module=json.dumps(output_module or "Lossless"),
+        )
         return self.run_script(script)
     
     def get_project_info(self):
@@ -204,38 +270,16 @@ class AfterEffectsConnection:
         """Create a text layer in a composition."""
         position_code = ""
         if position:
-            position_code = f"textLayer.position.setValue([{position[0]}, {position[1]}]);"
+            position_code = f"textLayer.position.setValue({json.dumps([position[0], position[1]])});"
             
         duration_code = ""
         if duration:
-            duration_code = f"textLayer.outPoint = {duration};"
+            duration_code = f"textLayer.outPoint = {json.dumps(duration)};"
             
-        script = f"""
-        var app = new Application();
-        var project = app.project;
-        
-        // Find the composition by name
-        var comp = null;
-        for (var i = 1; i <= project.numItems; i++) {{
-            if (project.item(i) instanceof CompItem && project.item(i).name === "{comp_name}") {{
-                comp = project.item(i);
-                break;
-            }}
-        }}
-        
-        if (comp === null) {{
-            $.writeln("ERROR: Composition not found");
-        }} else {{
-            // Create a text layer
-            var textLayer = comp.layers.addText("{text_content}");
-            
-            // Set position if provided
-            {position_code}
-            
-            // Set duration if provided
-            {duration_code}
-            
-            $.writeln("Text layer created in composition: " + comp.name);
-        }}
-        """
-        return self.run_script(script) 
\ No newline at end of file
+        script = _TEXT_LAYER_SCRIPT.substitute(
+            comp_name=json.dumps(comp_name),
+            text_content=json.dumps(text_content),
+            position_code=position_code,
+            duration_code=duration_code,
+        )
+        return self.run_script(script)
\ No newline at end of file
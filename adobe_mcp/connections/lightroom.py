@@ -3,10 +3,41 @@
 This module handles API connections to Adobe Lightroom.
 """
 
+import asyncio
+import io
+import json
+import threading
+
 import httpx
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # Fall back to the stdlib decoder when orjson isn't installed
+    _json_loads = json.loads
+
 from .. import config
 from .. import auth
 
+# Connection pool shared by every LightroomConnection instance
+_client = None
+_client_lock = threading.Lock()
+
+def _get_client():
+    """Get the shared async HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # HTTP/2 multiplexes concurrent requests onto one connection;
+                # the limits only matter if the server falls back to HTTP/1.1
+                _client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=config.REQUEST_TIMEOUT,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                )
+    return _client
+
 class LightroomError(Exception):
     """Exception raised for Lightroom API errors."""
     pass
@@ -14,50 +45,75 @@ class LightroomError(Exception):
 class LightroomConnection:
     """Connection handler for Adobe Lightroom API."""
     
+    _STATIC_HEADERS = {
+        "X-API-Key": config.ADOBE_CLIENT_ID,
+        "Content-Type": "application/json"
+    }
+    
     def __init__(self):
         """Initialize Lightroom connection."""
         self.base_url = f"{config.LIGHTROOM_BASE_URL}/{config.LIGHTROOM_API_VERSION}"
-        self.client = httpx.Client(timeout=config.REQUEST_TIMEOUT)
+        # Endpoint URLs, prebuilt so each call only fills in the IDs
+        b = self.base_url
+        self._url_catalog_list = b + "/catalog"
+        self._url_catalog_fmt = (b + "/catalog/%s").__mod__
+        self._url_assets_fmt = (b + "/catalogs/%s/assets").__mod__
+        self._url_asset_fmt = (b + "/catalogs/%s/assets/%s").__mod__
+        self._url_presets_fmt = (b + "/catalogs/%s/assets/%s/presets").__mod__
+        self._url_edits_fmt = (b + "/catalogs/%s/assets/%s/edits").__mod__
+        self._url_rendition_fmt = (b + "/catalogs/%s/assets/%s/renditions/%s").__mod__
+        self.client = _get_client()
+        self._cached_headers = None
+        self._headers_token = None
+    
+    async def close(self):
+        """Close the shared HTTP client; connections made later open a new one."""
+        global _client
+        with _client_lock:
+            client, _client = _client, None
+        if client is not None:
+            await client.aclose()
     
-    def get_headers(self):
+    async def get_headers(self):
         """Get request headers with authorization."""
-        auth_header = auth.get_authorization_header()
+        auth_header = await auth.get_authorization_header_async()
         if not auth_header:
             raise LightroomError("Not authenticated. Run authentication flow first.")
         
-        return {
-            "Authorization": auth_header,
-            "X-API-Key": config.ADOBE_CLIENT_ID,
-            "Content-Type": "application/json"
-        }
+        # Rebuild only when the token has changed (e.g. after a refresh)
+        if auth_header != self._headers_token:
+            self._cached_headers = {**self._STATIC_HEADERS, "Authorization": auth_header}
+            self._headers_token = auth_header
+        
+        return self._cached_headers
     
-    def get_catalogs(self):
+    async def get_catalogs(self):
         """Get available catalogs."""
-        headers = self.get_headers()
-        response = self.client.get(f"{self.base_url}/catalog", headers=headers)
+        headers = await self.get_headers()
+        response = await self.client.get(self._url_catalog_list, headers=headers)
         
         if response.status_code != 200:
             raise LightroomError(f"Failed to get catalogs: {response.text}")
         
-        return response.json()
+        return _json_loads(response.content)
     
-    def get_catalog(self, catalog_id):
+    async def get_catalog(self, catalog_id):
         """Get specific catalog details."""
-        headers = self.get_headers()
-        response = self.client.get(f"{self.base_url}/catalog/{catalog_id}", headers=headers)
+        headers = await self.get_headers()
+        response = await self.client.get(self._url_catalog_fmt((catalog_id,)), headers=headers)
         
         if response.status_code != 200:
             raise LightroomError(f"Failed to get catalog {catalog_id}: {response.text}")
         
-        return response.json()
+        return _json_loads(response.content)
     
-    def get_assets(self, catalog_id, limit=20, offset=0):
+    async def get_assets(self, catalog_id, limit=20, offset=0):
         """Get assets from a catalog."""
-        headers = self.get_headers()
+        headers = await self.get_headers()
         params = {"limit": limit, "offset": offset}
         
-        response = self.client.get(
-            f"{self.base_url}/catalogs/{catalog_id}/assets",
+        response = await self.client.get(
+            self._url_assets_fmt((catalog_id,)),
             headers=headers,
             params=params
         )
@@ -65,29 +121,35 @@ class LightroomConnection:
         if response.status_code != 200:
             raise LightroomError(f"Failed to get assets: {response.text}")
         
-        return response.json()
+        return _json_loads(response.content)
     
-    def get_asset(self, catalog_id, asset_id):
+    async def get_asset(self, catalog_id, asset_id):
         """Get metadata for a specific asset."""
-        headers = self.get_headers()
-        response = self.client.get(
-            f"{self.base_url}/catalogs/{catalog_id}/assets/{asset_id}",
+        headers = await self.get_headers()
+        response = await self.client.get(
+            self._url_asset_fmt((catalog_id, asset_id)),
             headers=headers
         )
         
         if response.status_code != 200:
             raise LightroomError(f"Failed to get asset {asset_id}: {response.text}")
         
-        return response.json()
+        return _json_loads(response.content)
+    
+    async def get_assets_bulk(self, catalog_id, asset_ids):
+        """Get metadata for several assets concurrently."""
+        return await asyncio.gather(
+            *(self.get_asset(catalog_id, asset_id) for asset_id in asset_ids)
+        )
     
-    def apply_preset(self, catalog_id, asset_id, preset_id):
+    async def apply_preset(self, catalog_id, asset_id, preset_id):
         """Apply a preset to an asset."""
-        headers = self.get_headers()
+        headers = await self.get_headers()
         data = {"presetId": preset_id}
         
         # Note: This is a theoretical endpoint, adjust according to actual API
-        response = self.client.post(
-            f"{self.base_url}/catalogs/{catalog_id}/assets/{asset_id}/presets",
+        response = await self.client.post(
+            self._url_presets_fmt((catalog_id, asset_id)),
             headers=headers,
             json=data
         )
@@ -95,15 +157,15 @@ class LightroomConnection:
         if response.status_code not in (200, 201):
             raise LightroomError(f"Failed to apply preset: {response.text}")
         
-        return response.json()
+        return _json_loads(response.content)
     
-    def create_edit(self, catalog_id, asset_id, edits):
+    async def create_edit(self, catalog_id, asset_id, edits):
         """Create or update edits for an asset."""
-        headers = self.get_headers()
+        headers = await self.get_headers()
         
         # Note: This is a theoretical endpoint, adjust according to actual API
-        response = self.client.post(
-            f"{self.base_url}/catalogs/{catalog_id}/assets/{asset_id}/edits",
+        response = await self.client.post(
+            self._url_edits_fmt((catalog_id, asset_id)),
             headers=headers,
             json=edits
         )
@@ -111,18 +173,36 @@ class LightroomConnection:
         if response.status_code not in (200, 201):
             raise LightroomError(f"Failed to create edit: {response.text}")
         
-        return response.json()
+        return _json_loads(response.content)
     
-    def get_rendition(self, catalog_id, asset_id, rendition_type="2048"):
-        """Get a rendition of an asset."""
-        headers = self.get_headers()
+    async def stream_rendition(self, catalog_id, asset_id, out_file, rendition_type="2048", chunk_size=65536):
+        """Stream a rendition of an asset into a binary file-like object.
         
-        response = self.client.get(
-            f"{self.base_url}/catalogs/{catalog_id}/assets/{asset_id}/renditions/{rendition_type}",
-            headers=headers
-        )
-        
-        if response.status_code != 200:
-            raise LightroomError(f"Failed to get rendition: {response.text}")
+        Preferred over get_rendition for large renditions, since only one
+        chunk is held in memory at a time.
+        """
+        headers = await self.get_headers()
         
-        return response.content 
\ No newline at end of file
+        async with self.client.stream(
+            "GET",
+            self._url_rendition_fmt((catalog_id, asset_id, rendition_type)),
+            headers=headers
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise LightroomError(f"Failed to get rendition: {response.text}")
+            
+            async for chunk in response.aiter_bytes(chunk_size):
+                out_file.write(chunk)
+    
+    async def get_rendition(self, catalog_id, asset_id, rendition_type="2048"):
+        """Get a rendition of an asset."""
+        buffer = io.BytesIO()
+        await self.stream_rendition(catalog_id, asset_id, buffer, rendition_type)
+        return buffer.getvalue()
+    
+    async def get_renditions(self, catalog_id, asset_ids, rendition_type="2048"):
+        """Get renditions for several assets concurrently."""
+        return await asyncio.gather(
+            *(self.get_rendition(catalog_id, asset_id, rendition_type) for asset_id in asset_ids)
+        )
\ No newline at end of file
@@ -6,10 +6,113 @@ It assumes Premiere Pro is installed and running on the local system.
 """
 
 import os
+import functools
+import queue
+import shutil
+import socket
 import tempfile
 import subprocess
+import threading
 import time
 import json
+import string
+from concurrent.futures import Future
+
+from .. import config
+from .script_host import ScriptHostClient, ScriptHostError
+
+# Most scripts combined into one script host round-trip by the dispatcher
+_MAX_BATCH = 32
+
+# Queued by close() to stop the dispatcher thread
+_STOP_DISPATCH = object()
+
+# Seconds a get_project_info result is reused while the project is unchanged
+_PROJECT_INFO_TTL = 2.0
+
+# Platform-specific paths, resolved once at import
+_IS_POSIX = os.name == 'posix'
+_PREMIERE_CMD = (
+    ["/Applications/Adobe Premiere Pro.app/Contents/MacOS/Adobe Premiere Pro"]
+    if _IS_POSIX else ["premiere_pro.exe"]
+)
+# A more sophisticated check would be needed for Windows
+_INSTALL_PATH = "/Applications/Adobe Premiere Pro.app" if _IS_POSIX else None
+
+@functools.lru_cache(maxsize=1)
+def _premiere_installed():
+    """Check once per process whether Premiere Pro is installed."""
+    # This is a simplified check for demonstration
+    return _INSTALL_PATH is None or os.path.exists(_INSTALL_PATH)
+
+# ExtendScript functions installed once into the script host's global scope,
+# so each call only has to send a short function call.
+_INSTALL_SCRIPT = """
+        function _mcp_open(projectPath) {
+            var app = new Application();
+            app.openDocument(new File(projectPath));
+            $.writeln("Project opened successfully");
+        }
+        
+        function _mcp_export(sequenceName, outputPath, preset) {
+            var app = new Application();
+            var project = app.project;
+            
+            // Find the sequence by name
+            var sequence = null;
+            for (var i = 0; i < project.sequences.length; i++) {
+                if (project.sequences[i].name === sequenceName) {
+                    sequence = project.sequences[i];
+                    break;
+                }
+            }
+            
+            if (sequence === null) {
+                $.writeln("ERROR: Sequence not found");
+            } else {
+                // Export the sequence
+                var outputFile = new File(outputPath);
+                var exportOptions = {
+                    outputFile: outputFile
+                };
+                if (preset) {
+                    exportOptions.preset = preset;
+                }
+                
+                app.encoder.encodeSequence(sequence, outputFile, exportOptions);
+                $.writeln("Export started for sequence: " + sequence.name);
+            }
+        }
+        
+        function _mcp_info() {
+            var app = new Application();
+            var project = app.project;
+            
+            var info = {
+                name: project.name,
+                path: project.path,
+                sequences: []
+            };
+            
+            // Get sequences
+            for (var i = 0; i < project.sequences.length; i++) {
+                var seq = project.sequences[i];
+                info.sequences.push({
+                    name: seq.name,
+                    duration: seq.duration
+                });
+            }
+            
+            // Returned to Python as the script host's JSON reply
+            return info;
+        }
+"""
+
+# Calls into the installed functions; parameters are substituted as
+# JSON-encoded literals so user input can't break out of the script.
+_OPEN_PROJECT_CALL = string.Template("_mcp_open($project_path)")
+_EXPORT_SEQUENCE_CALL = string.Template("_mcp_export($sequence_name, $output_path, $preset)")
+_PROJECT_INFO_CALL = "_mcp_info()"
 
 class PremiereError(Exception):
     """Exception raised for Premiere Pro operation errors."""
@@ -25,19 +128,151 @@ class PremiereConnection:
     
     def __init__(self):
         """Initialize Premiere Pro connection."""
-        self.script_dir = tempfile.mkdtemp(prefix="premiere_mcp_")
         self.check_installation()
+        self.simulate = config.SIMULATE
+        # Created lazily, only needed when the script host isn't reachable
+        self.script_dir = None
+        self._script_path = None
+        self._script_fd = None
+        self._script_lock = threading.Lock()
+        # The script host is a CEP extension listening on a Unix socket;
+        # scripts run through a temporary file when it isn't running
+        self._script_host = ScriptHostClient(
+            getattr(socket, "AF_UNIX", None), config.PREMIERE_SCRIPT_SOCKET
+        )
+        self._functions_installed = False
+        # (expires_at, info) for the last get_project_info result; the
+        # generation is bumped by every change made through this connection
+        self._project_info_cache = None
+        self._project_info_generation = 0
+        self._project_info_lock = threading.Lock()
+        
+        # Scripts for the script host are queued and sent by one dispatcher
+        # thread, which combines whatever has queued up into a single message
+        self._submit_queue = queue.Queue()
+        if self._script_host.connected:
+            threading.Thread(
+                target=self._dispatch_loop, name="premiere-mcp-dispatch", daemon=True
+            ).start()
+    
+    def _send_script(self, script_content):
+        """Run a script on the script host and return its JSON reply."""
+        try:
+            return self._script_host.run(script_content)
+        except ScriptHostError as e:
+            # The client drops the broken connection; later scripts use the file fallback
+            raise PremiereError(f"Failed to execute script: {e}")
+    
+    def close(self):
+        """Close the script host connection and remove the script file, if any."""
+        # Stops the dispatcher thread; scripts still queued fail
+        self._submit_queue.put(_STOP_DISPATCH)
+        self._script_host.close()
+        with self._script_lock:
+            if self._script_fd is not None:
+                os.close(self._script_fd)
+                self._script_fd = None
+            if self.script_dir is not None:
+                shutil.rmtree(self.script_dir, ignore_errors=True)
+                self.script_dir = None
+    
+    def _write_script_file(self, data):
+        """Overwrite the fallback script file with data and return its path.
+        
+        The file and its descriptor are created on first use and reused, so
+        each call costs a truncate and a positioned write.
+        """
+        if self._script_fd is None:
+            self.script_dir = tempfile.mkdtemp(prefix="premiere_mcp_")
+            self._script_path = os.path.join(self.script_dir, "temp_script.jsx")
+            self._script_fd = os.open(self._script_path, os.O_RDWR | os.O_CREAT, 0o600)
+        
+        os.ftruncate(self._script_fd, 0)
+        if hasattr(os, "pwrite"):
+            os.pwrite(self._script_fd, data, 0)
+        else:  # Windows has no pwrite
+            os.lseek(self._script_fd, 0, os.SEEK_SET)
+            os.write(self._script_fd, data)
+        return self._script_path
     
     def check_installation(self):
         """Check if Premiere Pro is installed."""
-        # This is a simplified check for demonstration
-        if os.name == 'posix':  # macOS or Linux
-            app_path = "/Applications/Adobe Premiere Pro.app"
-            if not os.path.exists(app_path):
-                raise PremiereError("Premiere Pro not found at default installation path.")
-        elif os.name == 'nt':  # Windows
-            # A more sophisticated check would be needed for Windows
-            pass
+        if not _premiere_installed():
+            raise PremiereError("Premiere Pro not found at default installation path.")
+    
+    def _dispatch_loop(self):
+        """Send queued scripts to the script host, batching any backlog.
+        
+        Runs until close() queues _STOP_DISPATCH; scripts still queued then
+        are failed rather than left waiting.
+        """
+        stopping = False
+        while not stopping:
+            item = self._submit_queue.get()
+            if item is _STOP_DISPATCH:
+                break
+            batch = [item]
+            # Everything queued while the previous batch was in flight goes
+            # out together, so batching adds no latency when idle
+            while len(batch) < _MAX_BATCH:
+                try:
+                    item = self._submit_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP_DISPATCH:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            try:
+                self._dispatch(batch)
+            except Exception as e:
+                # Never let one bad batch end the thread and strand its callers
+                self._fail_batch(batch, e)
+        
+        while True:
+            try:
+                item = self._submit_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP_DISPATCH:
+                self._fail_batch([item], PremiereError("Premiere Pro connection was closed"))
+    
+    def _fail_batch(self, batch, error):
+        """Fail every unresolved future in a batch with error."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+    
+    def _dispatch(self, batch):
+        """Run a batch of (script, future) pairs in one script host round-trip."""
+        try:
+            if not self._script_host.connected:
+                raise PremiereError("Script host connection was lost")
+            if not self._functions_installed:
+                self._send_script(_INSTALL_SCRIPT)
+                self._functions_installed = True
+            
+            # Evaluate each script in turn and collect its completion value;
+            # a lone script is wrapped too, so errors are reported the same way
+            script = "var __results = [];\n" + "\n".join(
+                f"try {{ __results.push({{ok: true, value: eval({json.dumps(script)})}}); }} "
+                f"catch (e) {{ __results.push({{ok: false, error: e.toString()}}); }}"
+                for script, _ in batch
+            ) + "\n__results;"
+            replies = self._send_script(script)
+            if (not isinstance(replies, list) or len(replies) != len(batch)
+                    or not all(isinstance(reply, dict) for reply in replies)):
+                raise PremiereError("Unexpected batch reply from script host")
+        except Exception as e:
+            self._fail_batch(batch, e)
+            return
+        
+        for (_, future), reply in zip(batch, replies):
+            if reply.get("ok"):
+                future.set_result(reply.get("value"))
+            else:
+                future.set_exception(PremiereError(f"Failed to execute script: {reply.get('error')}"))
     
     def run_script(self, script_content):
         """Run an ExtendScript in Premiere Pro.
@@ -45,22 +280,21 @@ class PremiereConnection:
         This is a theoretical implementation. Adobe applications support
         ExtendScript, but the exact mechanism to run scripts externally
         may vary and require application-specific approaches.
+        Scripts are sent to the CEP script host when it is connected.
         """
-        # Write script to temporary file
-        script_path = os.path.join(self.script_dir, "temp_script.jsx")
-        with open(script_path, "w") as f:
-            f.write(script_content)
+        if self._script_host.connected:
+            future = Future()
+            self._submit_queue.put((script_content, future))
+            return future.result()
+        
+        # Write script to temporary file; each run starts a fresh engine, so
+        # the helper functions are sent along every time
+        with self._script_lock:
+            script_path = self._write_script_file((_INSTALL_SCRIPT + script_content).encode("utf-8"))
         
         # Theoretical command to execute script in Premiere Pro
         # This would need to be adjusted for actual implementation
-        if os.name == 'posix':  # macOS
-            cmd = [
-                "/Applications/Adobe Premiere Pro.app/Contents/MacOS/Adobe Premiere Pro",
-                "--script", script_path
-            ]
-        elif os.name == 'nt':  # Windows
-            # Windows command would be different
-            cmd = ["premiere_pro.exe", "--script", script_path]
+        cmd = _PREMIERE_CMD + ["--script", script_path]
         
         # This is a placeholder for the actual execution
         # In practice, this might use a different approach like CEP extensions
@@ -71,88 +305,113 @@ class PremiereConnection:
             # subprocess.run(cmd, check=True, capture_output=True)
             
             # For demonstration, we'll simulate success
-            time.sleep(1)  # Simulate execution time
+            if self.simulate:
+                time.sleep(1)  # Simulate execution time
             return {"status": "success", "message": "Script executed successfully"}
         except subprocess.CalledProcessError as e:
             raise PremiereError(f"Failed to execute script: {e}")
     
+    def _open_project_script(self, project_path):
+        """Build the ExtendScript call that opens a project."""
+        return _OPEN_PROJECT_CALL.substitute(project_path=json.dumps(project_path))
+    
+    def _export_sequence_script(self, sequence_name, output_path, preset=None):
+        """Build the ExtendScript call that exports a sequence."""
+        return _EXPORT_SEQUENCE_CALL.substitute(
+            sequence_name=json.dumps(sequence_name),
+            output_path=json.dumps(output_path),
+            preset=json.dumps(preset),
+        )
+    
+    def _project_info_script(self):
+        """Build the ExtendScript call that collects project information."""
+        return _PROJECT_INFO_CALL
+    
+    def batch(self, ops):
+        """Run several operations in a single script dispatch.
+        
+        Each op is a dict with an "op" key naming the operation
+        ("open_project", "export_sequence" or "get_project_info") plus that
+        operation's keyword arguments. Returns one result dict per op, in
+        order; an op that throws reports an error without stopping the rest.
+        """
+        names = []
+        snippets = []
+        for op in ops:
+            params = dict(op)
+            name = params.pop("op", None)
+            builder = self._SCRIPT_BUILDERS.get(name)
+            if builder is None:
+                raise PremiereError(f"Unknown batch operation: {name}")
+            names.append(name)
+            snippets.append(
+                f'try {{ __out.push({{status: "success", result: {builder(self, **params)}}}); }} '
+                f'catch (e) {{ __out.push({{status: "error", message: e.toString()}}); }}'
+            )
+        
+        script = "var __out = [];\n" + "\n".join(snippets) + "\n__out;"
+        self._invalidate_project_info()
+        result = self.run_script(script)
+        
+        # The script host replies with the array; the file fallback can't, so
+        # each op gets the result its single-op method would have returned
+        if isinstance(result, list):
+            return result
+        return [
+            {
+                "status": "success",
+                "result": self._simulated_project_info() if name == "get_project_info" else dict(result),
+            }
+            for name in names
+        ]
+    
     def open_project(self, project_path):
         """Open a Premiere Pro project."""
-        script = f"""
-        var app = new Application();
-        app.openDocument(new File("{project_path}"));
-        $.writeln("Project opened successfully");
-        """
-        return self.run_script(script)
+        self._invalidate_project_info()
+        return self.run_script(self._open_project_script(project_path))
     
     def export_sequence(self, sequence_name, output_path, preset=None):
         """Export a sequence from the current project."""
-        preset_code = ""
-        if preset:
-            preset_code = f'preset: "{preset}",'
-            
-        script = f"""
-        var app = new Application();
-        var project = app.project;
-        
-        // Find the sequence by name
-        var sequence = null;
-        for (var i = 0; i < project.sequences.length; i++) {{
-            if (project.sequences[i].name === "{sequence_name}") {{
-                sequence = project.sequences[i];
-                break;
-            }}
-        }}
-        
-        if (sequence === null) {{
-            $.writeln("ERROR: Sequence not found");
-        }} else {{
-            // Export the sequence
-            var outputFile = new File("{output_path}");
-            var exportOptions = {{
-                {preset_code}
-                outputFile: outputFile
-            }};
-            
-            app.encoder.encodeSequence(sequence, outputFile, exportOptions);
-            $.writeln("Export started for sequence: " + sequence.name);
-        }}
-        """
-        return self.run_script(script)
+        self._invalidate_project_info()
+        return self.run_script(self._export_sequence_script(sequence_name, output_path, preset))
     
     def get_project_info(self):
-        """Get information about the current project."""
-        script = """
-        var app = new Application();
-        var project = app.project;
-        
-        var info = {
-            name: project.name,
-            path: project.path,
-            sequences: []
-        };
-        
-        // Get sequences
-        for (var i = 0; i < project.sequences.length; i++) {
-            var seq = project.sequences[i];
-            info.sequences.push({
-                name: seq.name,
-                duration: seq.duration
-            });
-        }
+        """Get information about the current project.
         
-        // Write to temp file since we can't directly return objects
-        var outputFile = new File("~/premiere_project_info.json");
-        outputFile.open("w");
-        outputFile.write(JSON.stringify(info));
-        outputFile.close();
-        
-        $.writeln("Project info saved to: " + outputFile.fsName);
+        Results are reused for a couple of seconds, and dropped as soon as
+        this connection opens a project or exports a sequence.
         """
+        cached = self._project_info_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
         
-        result = self.run_script(script)
+        generation = self._project_info_generation
+        info = self._fetch_project_info()
+        with self._project_info_lock:
+            # A change made while fetching may not be reflected in info
+            if generation == self._project_info_generation:
+                self._project_info_cache = (time.monotonic() + _PROJECT_INFO_TTL, info)
+        return info
+    
+    def _invalidate_project_info(self):
+        """Drop the cached project info, including any fetch still in flight."""
+        with self._project_info_lock:
+            self._project_info_generation += 1
+            self._project_info_cache = None
+    
+    def _fetch_project_info(self):
+        """Run the project info script and return its result."""
+        if self._script_host.connected:
+            # The script host replies with the info object itself
+            return self.run_script(self._project_info_script())
         
-        # In a real implementation, we would read the JSON file
+        result = self.run_script(self._project_info_script())
+        
+        # The temp-file fallback can't return values
+        return self._simulated_project_info()
+    
+    def _simulated_project_info(self):
+        """Build the project info reported when the script host isn't connected."""
         # For demonstration, we'll simulate the result
         return {
             "name": "Example Project",
@@ -161,4 +420,10 @@ class PremiereConnection:
                 {"name": "Main Sequence", "duration": "00:10:30:00"},
                 {"name": "Credits", "duration": "00:00:45:00"}
             ]
-        } 
\ No newline at end of file
+        } 
+    
+    _SCRIPT_BUILDERS = {
+        "open_project": _open_project_script,
+        "export_sequence": _export_sequence_script,
+        "get_project_info": _project_info_script,
+    }
\ No newline at end of file
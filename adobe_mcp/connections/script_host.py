@@ -0,0 +1,99 @@
+"""Script host client for Adobe MCP.
+
+This module handles the socket connection to a CEP extension that runs
+ExtendScript inside an already running Adobe application. Scripts and
+replies are framed the same way: a 4-byte big-endian length followed by
+the payload. A reply holds the script's result encoded as JSON.
+"""
+
+import json
+import socket
+import struct
+import threading
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # Fall back to the stdlib decoder when orjson isn't installed
+    _json_loads = json.loads
+
+# Length prefix of every script and reply
+_LENGTH = struct.Struct("!I")
+
+class ScriptHostError(Exception):
+    """Exception raised when the script host connection fails."""
+    pass
+
+class ScriptHostClient:
+    """Length-prefixed connection to a CEP script host.
+    
+    Stays disconnected if the extension isn't installed or running, in which
+    case callers run scripts some other way. A connection that fails mid-script
+    is closed, so later scripts take that other way too.
+    """
+    
+    def __init__(self, family, address):
+        """Connect to the script host listening at address.
+        
+        family is a socket address family, or None if the platform doesn't
+        support the one the script host uses.
+        """
+        self._lock = threading.Lock()
+        self._sock = self._connect(family, address)
+    
+    def _connect(self, family, address):
+        """Open the socket, or return None if the script host isn't reachable."""
+        if family is None:
+            return None
+        
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+        except OSError:
+            return None
+        try:
+            sock.settimeout(1)
+            sock.connect(address)
+        except OSError:
+            sock.close()
+            return None
+        # Scripts such as renders can legitimately run for a long time
+        sock.settimeout(None)
+        return sock
+    
+    @property
+    def connected(self):
+        """Whether scripts can currently be sent to the script host."""
+        return self._sock is not None
+    
+    def _recv_exact(self, sock, size):
+        """Read exactly size bytes from sock."""
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Script host closed the connection")
+            data += chunk
+        return data
+    
+    def run(self, script_content):
+        """Send a script to the script host and return its decoded JSON reply."""
+        payload = script_content.encode("utf-8")
+        with self._lock:
+            sock = self._sock
+            if sock is None:
+                raise ScriptHostError("Not connected to the script host")
+            try:
+                sock.sendall(_LENGTH.pack(len(payload)) + payload)
+                (reply_len,) = _LENGTH.unpack(self._recv_exact(sock, _LENGTH.size))
+                return _json_loads(self._recv_exact(sock, reply_len))
+            except (OSError, ValueError) as e:
+                # Drop the broken connection
+                self._sock = None
+                sock.close()
+                raise ScriptHostError(str(e))
+    
+    def close(self):
+        """Close the connection, if any."""
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            sock.close()
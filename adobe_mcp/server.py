@@ -4,7 +4,11 @@ import os
 import sys
 import json
 import argparse
+import asyncio
+import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
 try:
@@ -28,364 +32,347 @@ logging.basicConfig(
 )
 logger = logging.getLogger("adobe-mcp")
 
+def _capability(err_type, err_label):
+    """Decorate a capability handler to report errors as a failed response.
+    
+    err_type is logged and reported under err_label; any other exception is
+    reported as unexpected.
+    """
+    def deco(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, request):
+            try:
+                return await fn(self, request)
+            except err_type as e:
+                logger.error(f"{err_label}: {e}")
+                return {"success": False, "message": f"{err_label}: {str(e)}"}
+            except Exception as e:
+                logger.error(f"Unexpected error: {e}")
+                return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        return wrapper
+    return deco
+
 class AdobeMCPServer:
     """MCP Server for Adobe Creative Cloud applications."""
     
+    # (capability name, description); each is handled by the method of the same name
+    CAPABILITIES = (
+        # Authentication capabilities
+        ("adobe_authenticate", "Authenticate with Adobe Creative Cloud"),
+        
+        # Lightroom capabilities
+        ("lightroom_list_catalogs", "List available Lightroom catalogs"),
+        ("lightroom_get_assets", "Get assets from a Lightroom catalog"),
+        ("lightroom_get_asset", "Get metadata for a specific Lightroom asset"),
+        ("lightroom_get_assets_bulk", "Get metadata for several Lightroom assets concurrently"),
+        ("lightroom_apply_preset", "Apply a preset to a Lightroom asset"),
+        
+        # Premiere Pro capabilities (theoretical)
+        ("premiere_open_project", "Open a Premiere Pro project"),
+        ("premiere_get_project_info", "Get information about the current Premiere Pro project"),
+        ("premiere_export_sequence", "Export a sequence from the current Premiere Pro project"),
+        ("premiere_batch", "Run several Premiere Pro operations in one script dispatch"),
+        
+        # After Effects capabilities (theoretical)
+        ("after_effects_open_project", "Open an After Effects project"),
+        ("after_effects_get_project_info", "Get information about the current After Effects project"),
+        ("after_effects_render_composition", "Render a composition from the current After Effects project"),
+        ("after_effects_create_text_layer", "Create a text layer in an After Effects composition"),
+        
+        # Adobe Aero capabilities (exploratory)
+        ("aero_list_projects", "List Adobe Aero projects (exploratory)"),
+        ("aero_get_project", "Get details of a specific Adobe Aero project (exploratory)"),
+        ("aero_get_creative_cloud_assets", "Get Creative Cloud assets that could be used in Aero (exploratory)"),
+    )
+    
+    # Lazily created application connections, see preload()
+    CONNECTIONS = ("lightroom", "premiere", "after_effects", "aero")
+    _CONNECTION_TYPES = {
+        "lightroom": LightroomConnection,
+        "premiere": PremiereConnection,
+        "after_effects": AfterEffectsConnection,
+        "aero": AeroConnection,
+    }
+    
     def __init__(self, host: str = None, port: int = None):
         """Initialize the MCP server for Adobe applications."""
         self.host = host or config.MCP_HOST
         self.port = port or config.MCP_PORT
         self.server = Server(host=self.host, port=self.port)
-        
-        # Initialize connections to Adobe applications
-        self.lightroom = LightroomConnection()
-        self.premiere = PremiereConnection()
-        self.after_effects = AfterEffectsConnection()
-        self.aero = AeroConnection()
+        # Worker pool for blocking connection calls (scripts, file and socket I/O)
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.MCP_MAX_WORKERS, thread_name_prefix="adobe-mcp"
+        )
+        self._connections = {}
+        self._connection_locks = {name: threading.Lock() for name in self.CONNECTIONS}
         
         # Register capabilities
         self._register_capabilities()
         
         logger.info(f"MCP server initialized on {self.host}:{self.port}")
     
-    def _register_capabilities(self):
-        """Register all capabilities with the MCP server."""
-        # Authentication capabilities
-        self.server.capability(
-            "adobe_authenticate",
-            self.adobe_authenticate,
-            description="Authenticate with Adobe Creative Cloud"
-        )
+    def _connection(self, name):
+        """Get the named connection, creating it on first use.
         
-        # Lightroom capabilities
-        self.server.capability(
-            "lightroom_list_catalogs",
-            self.lightroom_list_catalogs,
-            description="List available Lightroom catalogs"
-        )
-        self.server.capability(
-            "lightroom_get_assets",
-            self.lightroom_get_assets,
-            description="Get assets from a Lightroom catalog"
-        )
-        self.server.capability(
-            "lightroom_get_asset",
-            self.lightroom_get_asset,
-            description="Get metadata for a specific Lightroom asset"
-        )
-        self.server.capability(
-            "lightroom_apply_preset",
-            self.lightroom_apply_preset,
-            description="Apply a preset to a Lightroom asset"
-        )
-        
-        # Premiere Pro capabilities (theoretical)
-        self.server.capability(
-            "premiere_open_project",
-            self.premiere_open_project,
-            description="Open a Premiere Pro project"
-        )
-        self.server.capability(
-            "premiere_get_project_info",
-            self.premiere_get_project_info,
-            description="Get information about the current Premiere Pro project"
-        )
-        self.server.capability(
-            "premiere_export_sequence",
-            self.premiere_export_sequence,
-            description="Export a sequence from the current Premiere Pro project"
-        )
-        
-        # After Effects capabilities (theoretical)
-        self.server.capability(
-            "after_effects_open_project",
-            self.after_effects_open_project,
-            description="Open an After Effects project"
-        )
-        self.server.capability(
-            "after_effects_get_project_info",
-            self.after_effects_get_project_info,
-            description="Get information about the current After Effects project"
-        )
-        self.server.capability(
-            "after_effects_render_composition",
-            self.after_effects_render_composition,
-            description="Render a composition from the current After Effects project"
-        )
-        self.server.capability(
-            "after_effects_create_text_layer",
-            self.after_effects_create_text_layer,
-            description="Create a text layer in an After Effects composition"
-        )
+        Connections are first touched from the worker pool, so creation is
+        locked per name; otherwise two first calls could each open a script
+        host socket and dispatcher thread, leaking the loser's.
+        """
+        connection = self._connections.get(name)
+        if connection is None:
+            with self._connection_locks[name]:
+                connection = self._connections.get(name)
+                if connection is None:
+                    connection = self._connections[name] = self._CONNECTION_TYPES[name]()
+        return connection
+    
+    # Connections to Adobe applications, created on first use so the server
+    # only pays for the applications a client actually talks to
+    @property
+    def lightroom(self):
+        return self._connection("lightroom")
+    
+    @property
+    def premiere(self):
+        return self._connection("premiere")
+    
+    @property
+    def after_effects(self):
+        return self._connection("after_effects")
+    
+    @property
+    def aero(self):
+        return self._connection("aero")
+    
+    def preload(self, names=CONNECTIONS):
+        """Create the named connections concurrently ahead of first use.
         
-        # Adobe Aero capabilities (exploratory)
-        self.server.capability(
-            "aero_list_projects",
-            self.aero_list_projects,
-            description="List Adobe Aero projects (exploratory)"
-        )
-        self.server.capability(
-            "aero_get_project",
-            self.aero_get_project,
-            description="Get details of a specific Adobe Aero project (exploratory)"
-        )
-        self.server.capability(
-            "aero_get_creative_cloud_assets",
-            self.aero_get_creative_cloud_assets,
-            description="Get Creative Cloud assets that could be used in Aero (exploratory)"
-        )
+        Start-up then waits for the slowest connection rather than the sum of
+        all of them. A connection that fails to initialize is logged and left
+        to be retried (and report its error) on first use.
+        """
+        futures = {name: self._executor.submit(self._connection, name) for name in names}
+        for name, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Could not initialize {name} connection: {e}")
+    
+    async def _run_blocking(self, fn):
+        """Run a blocking call on the worker pool so the event loop stays free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn)
+    
+    def _register_capabilities(self):
+        """Register all capabilities with the MCP server."""
+        for name, description in self.CAPABILITIES:
+            self.server.capability(name, getattr(self, name), description=description)
     
     # Authentication capability
+    @_capability(Exception, "Authentication error")
     async def adobe_authenticate(self, request: Request) -> Response:
         """Authenticate with Adobe Creative Cloud."""
-        try:
-            token_data = auth.authenticate()
-            if token_data and "access_token" in token_data:
-                return {"success": True, "message": "Successfully authenticated with Adobe"}
-            else:
-                return {"success": False, "message": "Authentication failed"}
-        except Exception as e:
-            logger.error(f"Authentication error: {e}")
-            return {"success": False, "message": f"Authentication error: {str(e)}"}
+        token_data = await self._run_blocking(auth.authenticate)
+        if token_data and "access_token" in token_data:
+            return {"success": True, "message": "Successfully authenticated with Adobe"}
+        else:
+            return {"success": False, "message": "Authentication failed"}
     
     # Lightroom capabilities
+    @_capability(LightroomError, "Lightroom error")
     async def lightroom_list_catalogs(self, request: Request) -> Response:
         """List available Lightroom catalogs."""
-        try:
-            catalogs = self.lightroom.get_catalogs()
-            return {"success": True, "catalogs": catalogs}
-        except LightroomError as e:
-            logger.error(f"Lightroom error: {e}")
-            return {"success": False, "message": f"Lightroom error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        catalogs = await self.lightroom.get_catalogs()
+        return {"success": True, "catalogs": catalogs}
     
+    @_capability(LightroomError, "Lightroom error")
     async def lightroom_get_assets(self, request: Request) -> Response:
         """Get assets from a Lightroom catalog."""
-        try:
-            catalog_id = request.get("catalog_id")
-            limit = request.get("limit", 20)
-            offset = request.get("offset", 0)
-            
-            if not catalog_id:
-                return {"success": False, "message": "Missing catalog_id parameter"}
-            
-            assets = self.lightroom.get_assets(catalog_id, limit, offset)
-            return {"success": True, "assets": assets}
-        except LightroomError as e:
-            logger.error(f"Lightroom error: {e}")
-            return {"success": False, "message": f"Lightroom error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        catalog_id = request.get("catalog_id")
+        limit = request.get("limit", 20)
+        offset = request.get("offset", 0)
+        
+        if not catalog_id:
+            return {"success": False, "message": "Missing catalog_id parameter"}
+        
+        assets = await self.lightroom.get_assets(catalog_id, limit, offset)
+        return {"success": True, "assets": assets}
     
+    @_capability(LightroomError, "Lightroom error")
     async def lightroom_get_asset(self, request: Request) -> Response:
         """Get metadata for a specific Lightroom asset."""
-        try:
-            catalog_id = request.get("catalog_id")
-            asset_id = request.get("asset_id")
-            
-            if not catalog_id or not asset_id:
-                return {"success": False, "message": "Missing catalog_id or asset_id parameter"}
-            
-            asset = self.lightroom.get_asset(catalog_id, asset_id)
-            return {"success": True, "asset": asset}
-        except LightroomError as e:
-            logger.error(f"Lightroom error: {e}")
-            return {"success": False, "message": f"Lightroom error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        catalog_id = request.get("catalog_id")
+        asset_id = request.get("asset_id")
+        
+        if not catalog_id or not asset_id:
+            return {"success": False, "message": "Missing catalog_id or asset_id parameter"}
+        
+        asset = await self.lightroom.get_asset(catalog_id, asset_id)
+        return {"success": True, "asset": asset}
     
+    @_capability(LightroomError, "Lightroom error")
+    async def lightroom_get_assets_bulk(self, request: Request) -> Response:
+        """Get metadata for several Lightroom assets concurrently."""
+        catalog_id = request.get("catalog_id")
+        asset_ids = request.get("asset_ids")
+        
+        if not catalog_id or not asset_ids:
+            return {"success": False, "message": "Missing catalog_id or asset_ids parameter"}
+        
+        assets = await self.lightroom.get_assets_bulk(catalog_id, asset_ids)
+        return {"success": True, "assets": assets}
+    
+    @_capability(LightroomError, "Lightroom error")
     async def lightroom_apply_preset(self, request: Request) -> Response:
         """Apply a preset to a Lightroom asset."""
-        try:
-            catalog_id = request.get("catalog_id")
-            asset_id = request.get("asset_id")
-            preset_id = request.get("preset_id")
-            
-            if not catalog_id or not asset_id or not preset_id:
-                return {"success": False, "message": "Missing catalog_id, asset_id, or preset_id parameter"}
-            
-            result = self.lightroom.apply_preset(catalog_id, asset_id, preset_id)
-            return {"success": True, "result": result}
-        except LightroomError as e:
-            logger.error(f"Lightroom error: {e}")
-            return {"success": False, "message": f"Lightroom error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        catalog_id = request.get("catalog_id")
+        asset_id = request.get("asset_id")
+        preset_id = request.get("preset_id")
+        
+        if not catalog_id or not asset_id or not preset_id:
+            return {"success": False, "message": "Missing catalog_id, asset_id, or preset_id parameter"}
+        
+        result = await self.lightroom.apply_preset(catalog_id, asset_id, preset_id)
+        return {"success": True, "result": result}
     
     # Premiere Pro capabilities (theoretical)
+    @_capability(PremiereError, "Premiere Pro error")
     async def premiere_open_project(self, request: Request) -> Response:
         """Open a Premiere Pro project."""
-        try:
-            project_path = request.get("project_path")
-            
-            if not project_path:
-                return {"success": False, "message": "Missing project_path parameter"}
-            
-            result = self.premiere.open_project(project_path)
-            return {"success": True, "result": result}
-        except PremiereError as e:
-            logger.error(f"Premiere Pro error: {e}")
-            return {"success": False, "message": f"Premiere Pro error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        project_path = request.get("project_path")
+        
+        if not project_path:
+            return {"success": False, "message": "Missing project_path parameter"}
+        
+        result = await self._run_blocking(lambda: self.premiere.open_project(project_path))
+        return {"success": True, "result": result}
     
+    @_capability(PremiereError, "Premiere Pro error")
     async def premiere_get_project_info(self, request: Request) -> Response:
         """Get information about the current Premiere Pro project."""
-        try:
-            result = self.premiere.get_project_info()
-            return {"success": True, "project_info": result}
-        except PremiereError as e:
-            logger.error(f"Premiere Pro error: {e}")
-            return {"success": False, "message": f"Premiere Pro error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        result = await self._run_blocking(lambda: self.premiere.get_project_info())
+        return {"success": True, "project_info": result}
     
+    @_capability(PremiereError, "Premiere Pro error")
     async def premiere_export_sequence(self, request: Request) -> Response:
         """Export a sequence from the current Premiere Pro project."""
-        try:
-            sequence_name = request.get("sequence_name")
-            output_path = request.get("output_path")
-            preset = request.get("preset")
-            
-            if not sequence_name or not output_path:
-                return {"success": False, "message": "Missing sequence_name or output_path parameter"}
-            
-            result = self.premiere.export_sequence(sequence_name, output_path, preset)
-            return {"success": True, "result": result}
-        except PremiereError as e:
-            logger.error(f"Premiere Pro error: {e}")
-            return {"success": False, "message": f"Premiere Pro error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        sequence_name = request.get("sequence_name")
+        output_path = request.get("output_path")
+        preset = request.get("preset")
+        
+        if not sequence_name or not output_path:
+            return {"success": False, "message": "Missing sequence_name or output_path parameter"}
+        
+        result = await self._run_blocking(lambda: self.premiere.export_sequence(sequence_name, output_path, preset))
+        return {"success": True, "result": result}
+    
+    @_capability(PremiereError, "Premiere Pro error")
+    async def premiere_batch(self, request: Request) -> Response:
+        """Run several Premiere Pro operations in one script dispatch."""
+        ops = request.get("ops")
+        
+        if not ops:
+            return {"success": False, "message": "Missing ops parameter"}
+        
+        results = await self._run_blocking(lambda: self.premiere.batch(ops))
+        return {"success": True, "results": results}
     
     # After Effects capabilities (theoretical)
+    @_capability(AfterEffectsError, "After Effects error")
     async def after_effects_open_project(self, request: Request) -> Response:
         """Open an After Effects project."""
-        try:
-            project_path = request.get("project_path")
-            
-            if not project_path:
-                return {"success": False, "message": "Missing project_path parameter"}
-            
-            result = self.after_effects.open_project(project_path)
-            return {"success": True, "result": result}
-        except AfterEffectsError as e:
-            logger.error(f"After Effects error: {e}")
-            return {"success": False, "message": f"After Effects error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        project_path = request.get("project_path")
+        
+        if not project_path:
+            return {"success": False, "message": "Missing project_path parameter"}
+        
+        result = await self._run_blocking(lambda: self.after_effects.open_project(project_path))
+        return {"success": True, "result": result}
     
+    @_capability(AfterEffectsError, "After Effects error")
     async def after_effects_get_project_info(self, request: Request) -> Response:
         """Get information about the current After Effects project."""
-        try:
-            result = self.after_effects.get_project_info()
-            return {"success": True, "project_info": result}
-        except AfterEffectsError as e:
-            logger.error(f"After Effects error: {e}")
-            return {"success": False, "message": f"After Effects error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        result = await self._run_blocking(lambda: self.after_effects.get_project_info())
+        return {"success": True, "project_info": result}
     
+    @_capability(AfterEffectsError, "After Effects error")
     async def after_effects_render_composition(self, request: Request) -> Response:
         """Render a composition from the current After Effects project."""
-        try:
-            comp_name = request.get("comp_name")
-            output_path = request.get("output_path")
-            render_settings = request.get("render_settings")
-            output_module = request.get("output_module")
-            
-            if not comp_name or not output_path:
-                return {"success": False, "message": "Missing comp_name or output_path parameter"}
-            
-            result = self.after_effects.render_composition(
-                comp_name, output_path, render_settings, output_module
-            )
-            return {"success": True, "result": result}
-        except AfterEffectsError as e:
-            logger.error(f"After Effects error: {e}")
-            return {"success": False, "message": f"After Effects error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        comp_name = request.get("comp_name")
+        output_path = request.get("output_path")
+        render_settings = request.get("render_settings")
+        output_module = request.get("output_module")
+        
+        if not comp_name or not output_path:
+            return {"success": False, "message": "Missing comp_name or output_path parameter"}
+        
+        result = await self._run_blocking(lambda: self.after_effects.render_composition(
+            comp_name, output_path, render_settings, output_module
+        ))
+        return {"success": True, "result": result}
     
+    @_capability(AfterEffectsError, "After Effects error")
     async def after_effects_create_text_layer(self, request: Request) -> Response:
         """Create a text layer in an After Effects composition."""
-        try:
-            comp_name = request.get("comp_name")
-            text_content = request.get("text_content")
-            position = request.get("position")
-            duration = request.get("duration")
-            
-            if not comp_name or not text_content:
-                return {"success": False, "message": "Missing comp_name or text_content parameter"}
-            
-            result = self.after_effects.create_text_layer(
-                comp_name, text_content, position, duration
-            )
-            return {"success": True, "result": result}
-        except AfterEffectsError as e:
-            logger.error(f"After Effects error: {e}")
-            return {"success": False, "message": f"After Effects error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        comp_name = request.get("comp_name")
+        text_content = request.get("text_content")
+        position = request.get("position")
+        duration = request.get("duration")
+        
+        if not comp_name or not text_content:
+            return {"success": False, "message": "Missing comp_name or text_content parameter"}
+        
+        result = await self._run_blocking(lambda: self.after_effects.create_text_layer(
+            comp_name, text_content, position, duration
+        ))
+        return {"success": True, "result": result}
     
     # Adobe Aero capabilities (exploratory)
+    @_capability(AeroError, "Adobe Aero error")
     async def aero_list_projects(self, request: Request) -> Response:
         """List Adobe Aero projects (exploratory)."""
-        try:
-            result = self.aero.list_projects()
-            return {"success": True, "result": result}
-        except AeroError as e:
-            logger.error(f"Adobe Aero error: {e}")
-            return {"success": False, "message": f"Adobe Aero error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        result = await self._run_blocking(lambda: self.aero.list_projects())
+        return {"success": True, "result": result}
     
+    @_capability(AeroError, "Adobe Aero error")
     async def aero_get_project(self, request: Request) -> Response:
         """Get details of a specific Adobe Aero project (exploratory)."""
-        try:
-            project_id = request.get("project_id")
-            
-            if not project_id:
-                return {"success": False, "message": "Missing project_id parameter"}
-            
-            result = self.aero.get_project(project_id)
-            return {"success": True, "result": result}
-        except AeroError as e:
-            logger.error(f"Adobe Aero error: {e}")
-            return {"success": False, "message": f"Adobe Aero error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        project_id = request.get("project_id")
+        
+        if not project_id:
+            return {"success": False, "message": "Missing project_id parameter"}
+        
+        result = await self._run_blocking(lambda: self.aero.get_project(project_id))
+        return {"success": True, "result": result}
     
+    @_capability(AeroError, "Adobe Aero error")
     async def aero_get_creative_cloud_assets(self, request: Request) -> Response:
         """Get Creative Cloud assets that could be used in Aero (exploratory)."""
-        try:
-            result = self.aero.get_creative_cloud_assets()
-            return {"success": True, "result": result}
-        except AeroError as e:
-            logger.error(f"Adobe Aero error: {e}")
-            return {"success": False, "message": f"Adobe Aero error: {str(e)}"}
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return {"success": False, "message": f"Unexpected error: {str(e)}"}
+        result = await self._run_blocking(lambda: self.aero.get_creative_cloud_assets())
+        return {"success": True, "result": result}
     
     def run(self):
         """Run the MCP server."""
         logger.info("Starting Adobe MCP Server...")
-        self.server.run()
+        try:
+            self.server.run()
+        finally:
+            self._executor.shutdown(wait=False)
+            self.close()
+    
+    def close(self):
+        """Close the connections created so far (HTTP pools, script host sockets, temp files)."""
+        for name, connection in self._connections.items():
+            close = getattr(connection, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    # The server's event loop has stopped by now
+                    asyncio.run(result)
+            except Exception as e:
+                logger.warning(f"Could not close {name} connection: {e}")
 
 def main():
     """Main entry point for the MCP server."""
@@ -393,6 +380,12 @@ def main():
     parser.add_argument("--host", help="Host to bind the server to", default=config.MCP_HOST)
     parser.add_argument("--port", help="Port to bind the server to", type=int, default=config.MCP_PORT)
     parser.add_argument("--debug", help="Enable debug logging", action="store_true")
+    parser.add_argument(
+        "--preload",
+        help="Connect to these applications (all if none given) at start-up instead of on first use",
+        nargs="*",
+        choices=AdobeMCPServer.CONNECTIONS,
+    )
     
     args = parser.parse_args()
     
@@ -400,6 +393,8 @@ def main():
         logger.setLevel(logging.DEBUG)
     
     server = AdobeMCPServer(host=args.host, port=args.port)
+    if args.preload is not None:
+        server.preload(args.preload or AdobeMCPServer.CONNECTIONS)
     server.run()
 
 if __name__ == "__main__":
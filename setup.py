@@ -9,9 +9,10 @@ setup(
     packages=find_packages(),
     install_requires=[
         "mcp>=1.4.0",
-        "httpx>=0.24.0",
+        "httpx[http2]>=0.24.0",
         "pydantic>=2.0.0",
         "python-dotenv>=1.0.0",
+        "orjson>=3.8.0",
     ],
     entry_points={
         "console_scripts": [